@@ -10,27 +10,138 @@ Features:
  - Input validation and helpful prompts
 """
 
+import bisect
+import functools
+import heapq
 import json
 import csv
+import math
+import sys
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # statistics fall back to pure-Python loops
+    np = None
+
+try:
+    import orjson
+except ImportError:  # persistence falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson.backends.yajl2_c as ijson  # C backend, ~10x the pure-Python one
+except ImportError:
+    try:
+        import ijson
+    except ImportError:  # loads fall back to parsing the whole file at once
+        ijson = None
+
+try:
+    import msgpack
+except ImportError:  # the compact binary save format becomes unavailable
+    msgpack = None
+
+try:
+    from numba import njit
+except ImportError:  # bucketing falls back to np.histogram / Python loops
+    njit = None
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _bucketize(avgs):
+        """Count averages into 5 grade buckets (F, D, C, B, A); NaN = F."""
+        counts = np.zeros(5, np.int64)
+        for i in range(avgs.shape[0]):
+            a = avgs[i]
+            if np.isnan(a) or a < 40.0:
+                counts[0] += 1
+            elif a < 50.0:
+                counts[1] += 1
+            elif a < 60.0:
+                counts[2] += 1
+            elif a < 80.0:
+                counts[3] += 1
+            else:
+                counts[4] += 1
+        return counts
+else:
+    _bucketize = None
+
+# Grade bucket boundaries, shared by every bucketing implementation.
+GRADE_BOUNDS = (40, 50, 60, 80)
+GRADE_LABELS = ("F", "D", "C", "B", "A")
+
+
+def _memoized(method):
+    """Cache a Gradebook query keyed on its arguments and the gradebook
+    version, so repeating a search or statistics call between mutations
+    is a dict lookup. The cache is cleared whenever the version bumps."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())), self._version)
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = method(self, *args, **kwargs)
+            return result
+    return wrapper
+
 
 class Student:
     """Represents a student with name, roll and a dict of subject->marks."""
+    __slots__ = ("name", "roll", "marks", "_name_lower", "_sum", "_count",
+                 "_avg_cache", "_book")
+
     def __init__(self, name: str, roll: int, marks: Optional[Dict[str, float]] = None):
         self.name = name.strip()
         self.roll = int(roll)
         self.marks = marks or {}  # e.g. {"Math": 85.0, "Physics": 78.5}
+        self._name_lower = self.name.lower()  # pre-normalized for search
+        # Running sum/count so get_average never rescans the marks dict.
+        self._sum = sum(self.marks.values())
+        self._count = len(self.marks)
+        self._avg_cache: Optional[float] = None
+        self._book = None  # owning Gradebook, set by add_student
 
     def set_mark(self, subject: str, mark: float):
-        assert 0 <= mark <= 100, "Mark must be between 0 and 100."
-        self.marks[subject.strip()] = float(mark)
+        mark = float(mark)
+        # Chained comparison is False for NaN, so this rejects it too.
+        if not (0.0 <= mark <= 100.0):
+            raise ValueError("Mark must be between 0 and 100.")
+        subject = subject.strip()
+        old = self.marks.get(subject)
+        if old is None:
+            self._count += 1
+            self._sum += mark
+        else:
+            self._sum += mark - old
+        self.marks[subject] = mark
+        self._avg_cache = None
+        if self._book is not None:
+            if old is None:
+                self._book._note_subject_added(subject)
+            else:
+                self._book._invalidate()
+
+    def remove_mark(self, subject: str) -> bool:
+        subject = subject.strip()
+        if subject not in self.marks:
+            return False
+        self._sum -= self.marks.pop(subject)
+        self._count -= 1
+        self._avg_cache = None
+        if self._book is not None:
+            self._book._note_subject_removed(subject)
+        return True
 
     def get_average(self) -> Optional[float]:
-        if not self.marks:
+        if not self._count:
             return None
-        total = sum(self.marks.values())
-        return total / len(self.marks)
+        if self._avg_cache is None:
+            self._avg_cache = self._sum / self._count
+        return self._avg_cache
 
     def to_dict(self) -> Dict:
         return {"name": self.name, "roll": self.roll, "marks": self.marks}
@@ -39,6 +150,22 @@ class Student:
     def from_dict(d: Dict):
         return Student(name=d["name"], roll=d["roll"], marks=d.get("marks", {}))
 
+    @staticmethod
+    def from_dict_trusted(d: Dict):
+        """Fast path for round-tripped JSON: values already have the right
+        types, so skip __init__'s strip/int coercions and fill the caches
+        in one shot."""
+        s = Student.__new__(Student)
+        s.name = d["name"]
+        s.roll = d["roll"]
+        s.marks = d.get("marks", {})
+        s._name_lower = s.name.lower()
+        s._count = len(s.marks)
+        s._sum = math.fsum(s.marks.values()) if s._count else 0.0
+        s._avg_cache = None
+        s._book = None
+        return s
+
     def __repr__(self):
         avg = self.get_average()
         avg_str = f"{avg:.2f}" if avg is not None else "N/A"
@@ -49,46 +176,166 @@ class Gradebook:
     """Manages many Student objects and provides utility operations."""
     def __init__(self):
         self.students: Dict[int, Student] = {}  # key = roll number
+        # Lazily-built structure-of-arrays cache used by the NumPy
+        # statistics paths: an interned subject table, a float32 marks
+        # matrix (rows = students, columns = subjects, NaN = absent),
+        # and the per-student averages/rolls derived from it.
+        self._subject_ids: Dict[str, int] = {}
+        self._marks = None
+        self._roll_to_row: Dict[int, int] = {}
+        self._avgs = None
+        self._rolls = None
+        # Running count of students holding each subject, so exports don't
+        # rescan every marks dict; the sorted view is cached until the set
+        # of subjects (not the counts) changes.
+        self._subject_counts: Counter = Counter()
+        self._sorted_subjects: Optional[List[str]] = None
+        # Mutation counter plus a result cache for repeated queries; see
+        # the _memoized decorator.
+        self._version = 0
+        self._cache: Dict = {}
+
+    # ---------------- Cache maintenance ----------------
+    def _invalidate(self) -> None:
+        self._version += 1
+        self._cache.clear()
+        self._subject_ids = {}
+        self._marks = None
+        self._roll_to_row = {}
+        self._avgs = None
+        self._rolls = None
+
+    def _note_subject_added(self, subject: str) -> None:
+        self._subject_counts[subject] += 1
+        if self._subject_counts[subject] == 1:
+            self._sorted_subjects = None
+        self._invalidate()
+
+    def _note_subject_removed(self, subject: str) -> None:
+        cnt = self._subject_counts[subject] - 1
+        if cnt <= 0:
+            del self._subject_counts[subject]
+            self._sorted_subjects = None
+        else:
+            self._subject_counts[subject] = cnt
+        self._invalidate()
+
+    def _subjects_sorted(self) -> List[str]:
+        if self._sorted_subjects is None:
+            self._sorted_subjects = sorted(self._subject_counts)
+        return self._sorted_subjects
+
+    def _rebuild(self) -> None:
+        n = len(self.students)
+        subject_ids: Dict[str, int] = {}
+        for s in self.students.values():
+            for sub in s.marks:
+                if sub not in subject_ids:
+                    subject_ids[sub] = len(subject_ids)
+        marks = np.full((n, len(subject_ids)), np.nan, dtype=np.float32)
+        roll_to_row: Dict[int, int] = {}
+        for row, s in enumerate(self.students.values()):
+            roll_to_row[s.roll] = row
+            for sub, m in s.marks.items():
+                marks[row, subject_ids[sub]] = m
+        self._subject_ids = subject_ids
+        self._marks = marks
+        self._roll_to_row = roll_to_row
+        self._rolls = np.fromiter(self.students.keys(), dtype=np.int64, count=n)
+        # Row averages in float64; rows with no marks become NaN.
+        counts = (~np.isnan(marks)).sum(axis=1)
+        sums = np.nansum(marks, axis=1, dtype=np.float64)
+        self._avgs = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
 
     # ---------------- Basic CRUD ----------------
     def add_student(self, student: Student) -> None:
         if student.roll in self.students:
             raise ValueError(f"Roll {student.roll} already exists.")
         self.students[student.roll] = student
+        student._book = self
+        for sub in student.marks:
+            self._subject_counts[sub] += 1
+            if self._subject_counts[sub] == 1:
+                self._sorted_subjects = None
+        self._invalidate()
 
     def get_student(self, roll: int) -> Optional[Student]:
         return self.students.get(int(roll))
 
     def delete_student(self, roll: int) -> bool:
-        return self.students.pop(int(roll), None) is not None
+        s = self.students.pop(int(roll), None)
+        if s is None:
+            return False
+        s._book = None
+        for sub in s.marks:
+            cnt = self._subject_counts[sub] - 1
+            if cnt <= 0:
+                del self._subject_counts[sub]
+                self._sorted_subjects = None
+            else:
+                self._subject_counts[sub] = cnt
+        self._invalidate()
+        return True
 
     def edit_student_name(self, roll: int, new_name: str) -> bool:
         s = self.get_student(roll)
         if not s:
             return False
         s.name = new_name.strip()
+        s._name_lower = s.name.lower()
+        self._invalidate()  # cached search results mention the old name
         return True
 
     # --------------- Searching / Listing ---------------
+    @_memoized
     def search_by_name(self, name_substring: str) -> List[Student]:
         q = name_substring.strip().lower()
-        return [s for s in self.students.values() if q in s.name.lower()]
+        return [s for s in self.students.values() if q in s._name_lower]
 
     def list_all(self) -> List[Student]:
         return sorted(self.students.values(), key=lambda s: s.roll)
 
+    def iter_students(self):
+        """Students in insertion order, without list_all's O(N log N) sort.
+
+        Use this on paths (JSON save, CSV export) that don't need roll
+        ordering; keep list_all for display, where sorted output matters.
+        """
+        return self.students.values()
+
     # ---------------- Statistics ----------------
+    @_memoized
     def class_average(self) -> Optional[float]:
-        avgs = [s.get_average() for s in self.students.values() if s.get_average() is not None]
+        if np is not None:
+            if self._avgs is None:
+                self._rebuild()
+            if self._avgs.size == 0 or np.isnan(self._avgs).all():
+                return None
+            return float(np.nanmean(self._avgs))
+        # fsum keeps the aggregate exact even when summing millions of
+        # averages; per-student sums stay plain sum() since K is small.
+        avgs = [a for s in self.students.values() if (a := s.get_average()) is not None]
         if not avgs:
             return None
-        return sum(avgs) / len(avgs)
+        return math.fsum(avgs) / len(avgs)
 
+    @_memoized
     def top_n_students(self, n: int = 3) -> List[Tuple[Student, float]]:
+        if np is not None:
+            if self._avgs is None:
+                self._rebuild()
+            scores = np.nan_to_num(self._avgs, nan=0.0)
+            if n < scores.size:
+                idx = np.argpartition(-scores, n)[:n]
+            else:
+                idx = np.arange(scores.size)
+            idx = idx[np.argsort(-scores[idx], kind="stable")]
+            return [(self.students[int(self._rolls[i])], float(scores[i])) for i in idx]
         scored = [(s, (s.get_average() or 0.0)) for s in self.students.values()]
         scored.sort(key=lambda x: x[1], reverse=True)
         return scored[:n]
 
+    @_memoized
     def grade_distribution(self) -> Dict[str, int]:
         """
         Returns a grade bucket distribution:
@@ -98,12 +345,57 @@ class Gradebook:
          - 'D' : 40 <= avg < 50
          - 'F' : avg < 40 or no marks
         """
+        if np is not None:
+            if self._avgs is None:
+                self._rebuild()
+            if _bucketize is not None:
+                counts = _bucketize(self._avgs)
+                return {
+                    "A": int(counts[4]),
+                    "B": int(counts[3]),
+                    "C": int(counts[2]),
+                    "D": int(counts[1]),
+                    "F": int(counts[0]),
+                }
+            valid = self._avgs[~np.isnan(self._avgs)]
+            counts, _ = np.histogram(
+                valid, bins=[-np.inf, 40, 50, 60, 80, np.inf]
+            )
+            # histogram bins run F, D, C, B, A; students without marks are F
+            return {
+                "A": int(counts[4]),
+                "B": int(counts[3]),
+                "C": int(counts[2]),
+                "D": int(counts[1]),
+                "F": int(counts[0]) + (self._avgs.size - valid.size),
+            }
+        # bisect maps an average to its bucket index without a per-student
+        # hash lookup or if/elif cascade.
+        counts = [0] * 5
+        for s in self.students.values():
+            avg = s.get_average()
+            counts[0 if avg is None else bisect.bisect_right(GRADE_BOUNDS, avg)] += 1
+        # Present A..F to match the NumPy path and the menu display.
+        return dict(zip(GRADE_LABELS[::-1], counts[::-1]))
+
+    @_memoized
+    def compute_stats(self, n: int = 3) -> Dict:
+        """
+        Compute class average, top-n students and grade distribution in a
+        single pass over the gradebook (menu option 7 needs all three).
+        Returns {"class_avg": float|None, "top": [(avg, roll, Student)],
+                 "buckets": {grade: count}}.
+        """
         buckets = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
+        total = 0.0
+        cnt = 0
+        heap: List[Tuple[float, int, Student]] = []
         for s in self.students.values():
             avg = s.get_average()
             if avg is None:
                 buckets["F"] += 1
-            elif avg >= 80:
+                continue
+            if avg >= 80:
                 buckets["A"] += 1
             elif avg >= 60:
                 buckets["B"] += 1
@@ -113,43 +405,133 @@ class Gradebook:
                 buckets["D"] += 1
             else:
                 buckets["F"] += 1
-        return buckets
+            total += avg
+            cnt += 1
+            if len(heap) < n:
+                heapq.heappush(heap, (avg, s.roll, s))
+            else:
+                heapq.heappushpop(heap, (avg, s.roll, s))
+        return {
+            "class_avg": total / cnt if cnt else None,
+            "top": sorted(heap, reverse=True),
+            "buckets": buckets,
+        }
 
     # ---------------- Persistence ----------------
     def save_to_json(self, filepath: str) -> None:
-        payload = [s.to_dict() for s in self.list_all()]
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        # No sort: JSON consumers don't care about roll order, and the
+        # insertion-ordered dict already matches add order.
+        payload = [s.to_dict() for s in self.iter_students()]
+        if orjson is not None:
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
         print(f"Saved {len(payload)} students to {filepath}.")
 
     def load_from_json(self, filepath: str) -> None:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
         loaded = 0
-        for item in data:
-            s = Student.from_dict(item)
-            self.students[s.roll] = s
-            loaded += 1
+        if ijson is not None:
+            # Stream one student at a time so memory stays bounded no
+            # matter how large the export file is.
+            with open(filepath, "rb") as f:
+                for item in ijson.items(f, "item"):
+                    marks = item.get("marks")
+                    if marks:
+                        # ijson parses numbers as Decimal; normalize to float
+                        item["marks"] = {k: float(v) for k, v in marks.items()}
+                    s = Student.from_dict_trusted(item)
+                    self.students[s.roll] = s
+                    s._book = self
+                    loaded += 1
+        else:
+            if orjson is not None:
+                with open(filepath, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            for item in data:
+                s = Student.from_dict_trusted(item)
+                self.students[s.roll] = s
+                s._book = self
+                loaded += 1
+        # Rebuild from scratch: a load can replace existing students
+        # (same roll), which per-student increments would double-count.
+        self._subject_counts = Counter(
+            sub for s in self.students.values() for sub in s.marks
+        )
+        self._sorted_subjects = None
+        self._invalidate()
+        print(f"Loaded {loaded} students from {filepath}.")
+
+    def save_to_msgpack(self, filepath: str) -> None:
+        """Compact binary save: subject names are written once in a header
+        and each student stores a positional list of marks (None = subject
+        not taken), instead of repeating every subject string per student.
+        """
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed.")
+        subjects = self._subjects_sorted()
+        with open(filepath, "wb") as f:
+            packer = msgpack.Packer(use_bin_type=True)
+            f.write(packer.pack({"subjects": subjects, "count": len(self.students)}))
+            for s in self.iter_students():
+                f.write(packer.pack({
+                    "n": s.name,
+                    "r": s.roll,
+                    "m": [s.marks.get(sub) for sub in subjects],
+                }))
+        print(f"Saved {len(self.students)} students to {filepath}.")
+
+    def load_from_msgpack(self, filepath: str) -> None:
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed.")
+        loaded = 0
+        with open(filepath, "rb") as f:
+            # Unpacker streams one top-level object at a time, so memory
+            # stays bounded regardless of file size.
+            unpacker = msgpack.Unpacker(f, raw=False)
+            header = next(unpacker)
+            subjects = header["subjects"]
+            for row in unpacker:
+                marks = {sub: m for sub, m in zip(subjects, row["m"]) if m is not None}
+                s = Student.from_dict_trusted(
+                    {"name": row["n"], "roll": row["r"], "marks": marks}
+                )
+                self.students[s.roll] = s
+                s._book = self
+                loaded += 1
+        # Rebuild from scratch: a load can replace existing students
+        # (same roll), which per-student increments would double-count.
+        self._subject_counts = Counter(
+            sub for s in self.students.values() for sub in s.marks
+        )
+        self._sorted_subjects = None
+        self._invalidate()
         print(f"Loaded {loaded} students from {filepath}.")
 
     def export_to_csv(self, filepath: str) -> None:
         # Collect all subjects to make columns consistent
-        subjects = set()
-        for s in self.students.values():
-            subjects.update(s.marks.keys())
-        subjects = sorted(subjects)
+        subjects = tuple(self._subjects_sorted())
 
-        headers = ["roll", "name"] + subjects + ["average"]
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
+        headers = ["roll", "name", *subjects, "average"]
+        # Precompute every row and hand the whole batch to the C csv
+        # writer in one call; the large buffer keeps write syscalls big.
+        rows = []
+        for s in self.iter_students():
+            avg = s.get_average()
+            rows.append([
+                s.roll,
+                s.name,
+                *[s.marks.get(sub, "") for sub in subjects],
+                f"{avg:.2f}" if avg is not None else "",
+            ])
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(headers)
-            for s in self.list_all():
-                row = [s.roll, s.name]
-                for sub in subjects:
-                    row.append(s.marks.get(sub, ""))
-                avg = s.get_average()
-                row.append(f"{avg:.2f}" if avg is not None else "")
-                writer.writerow(row)
+            writer.writerows(rows)
         print(f"Exported {len(self.students)} students to {filepath}.")
 
 
@@ -172,35 +554,63 @@ def input_float(prompt: str) -> float:
             print("Please enter a valid number.")
 
 
+def paste_marks(s: Student):
+    """Bulk-entry path: read 'subject mark' lines until a blank line.
+
+    All lines are parsed in one batch so the common all-valid case pays
+    for a single try/except instead of one per subject.
+    """
+    print("Paste 'subject mark' lines, one per line. Blank line to finish.")
+    lines = []
+    while True:
+        line = input().strip()
+        if not line:
+            break
+        lines.append(line)
+    try:
+        for line in lines:
+            subj, m = line.rsplit(" ", 1)
+            s.set_mark(subj, float(m))
+        print(f"Set {len(lines)} marks.")
+    except ValueError as e:
+        print("Invalid line:", line, "-", e)
+        print("Enter the remaining marks one at a time.")
+
+
 def create_student_interactive() -> Student:
     name = input("Name: ").strip()
     roll = input_int("Roll (integer): ")
     s = Student(name=name, roll=roll)
-    print("Enter marks for subjects. Type 'done' when finished.")
+    print("Enter marks for subjects. Type 'done' when finished, or 'paste' for bulk entry.")
     while True:
-        subj = input(" Subject name (or 'done'): ").strip()
+        subj = input(" Subject name (or 'done'/'paste'): ").strip()
         if subj.lower() == "done":
             break
+        if subj.lower() == "paste":
+            paste_marks(s)
+            continue
         mark_in = input(f"  Mark for {subj}: ").strip()
         try:
             mark = float(mark_in)
             s.set_mark(subj, mark)
-        except (ValueError, AssertionError) as e:
+        except ValueError as e:
             print("  Invalid mark:", e)
     return s
 
 
-def show_student_details(s: Student):
-    print("--------")
-    print(f"Name: {s.name}")
-    print(f"Roll: {s.roll}")
+def format_student_details(s: Student) -> str:
+    parts = ["--------", f"Name: {s.name}", f"Roll: {s.roll}"]
     if not s.marks:
-        print("Marks: No marks recorded.")
+        parts.append("Marks: No marks recorded.")
     else:
-        for sub, m in s.marks.items():
-            print(f"  {sub}: {m}")
-        avg = s.get_average()
-        print(f"Average: {avg:.2f}")
+        parts.extend(f"  {sub}: {m}" for sub, m in s.marks.items())
+        parts.append(f"Average: {s.get_average():.2f}")
+    return "\n".join(parts)
+
+
+def show_student_details(s: Student):
+    # One write instead of one print (and flush) per line.
+    sys.stdout.write(format_student_details(s) + "\n")
 
 
 def sample_data() -> Gradebook:
@@ -233,9 +643,11 @@ def main_menu():
         print("8) Save to JSON")
         print("9) Load from JSON (replace current)")
         print("10) Export CSV")
-        print("11) Exit")
+        print("11) Save to msgpack (compact binary)")
+        print("12) Load from msgpack (replace current)")
+        print("13) Exit")
 
-        choice = input("Choose (1-11): ").strip()
+        choice = input("Choose (1-13): ").strip()
         if choice == "1":
             try:
                 s = create_student_interactive()
@@ -248,8 +660,11 @@ def main_menu():
             all_students = gb.list_all()
             if not all_students:
                 print("No students.")
-            for s in all_students:
-                show_student_details(s)
+            else:
+                # Accumulate the whole listing and write it in one go.
+                sys.stdout.write(
+                    "\n".join(format_student_details(s) for s in all_students) + "\n"
+                )
 
         elif choice == "3":
             q = input("Enter name substring to search: ").strip()
@@ -287,12 +702,11 @@ def main_menu():
                     mark = input_float("Mark (0-100): ")
                     s.set_mark(subj, mark)
                     print("Mark set.")
-                except AssertionError as e:
+                except ValueError as e:
                     print("Error:", e)
             elif subchoice == "3":
                 subj = input("Subject name to remove: ").strip()
-                if subj in s.marks:
-                    s.marks.pop(subj)
+                if s.remove_mark(subj):
                     print("Removed.")
                 else:
                     print("Subject not found.")
@@ -307,16 +721,16 @@ def main_menu():
                 print("Not found.")
 
         elif choice == "7":
-            avg = gb.class_average()
-            if avg is None:
+            stats = gb.compute_stats(3)
+            if stats["class_avg"] is None:
                 print("No averages available yet.")
             else:
-                print(f"Class average: {avg:.2f}")
+                print(f"Class average: {stats['class_avg']:.2f}")
             print("Top 3 students:")
-            for s, sc in gb.top_n_students(3):
-                print(f"  Roll {s.roll} - {s.name} => {sc:.2f}")
+            for sc, roll, s in stats["top"]:
+                print(f"  Roll {roll} - {s.name} => {sc:.2f}")
             print("Grade distribution:")
-            for k, v in gb.grade_distribution().items():
+            for k, v in stats["buckets"].items():
                 print(f"  {k}: {v}")
 
         elif choice == "8":
@@ -342,11 +756,26 @@ def main_menu():
                 print("Error exporting:", e)
 
         elif choice == "11":
+            path = input("msgpack filepath to save (e.g. students.msgpack): ").strip()
+            try:
+                gb.save_to_msgpack(path)
+            except Exception as e:
+                print("Error saving:", e)
+
+        elif choice == "12":
+            path = input("msgpack filepath to load (e.g. students.msgpack): ").strip()
+            try:
+                gb = Gradebook()  # replace current
+                gb.load_from_msgpack(path)
+            except Exception as e:
+                print("Error loading:", e)
+
+        elif choice == "13":
             print("Bye!")
             break
 
         else:
-            print("Invalid choice. Please pick 1-11.")
+            print("Invalid choice. Please pick 1-13.")
 
 
 if __name__ == "__main__":